@@ -9,23 +9,86 @@ Usage:
     python generate_icon_sprite.py
 
 Features:
-- Robust XML parsing with proper DOM manipulation
+- Robust XML parsing with proper DOM manipulation (lxml when available)
 - Automatic coordinate system normalization
 - Smart background element filtering
+- Regex fast path for plain 24x24 path-only icons (the common Material case)
 - Handles all SVG structures (path, rect, circle, polygon, etc.)
 - Preserves transforms and applies coordinate scaling
 - Creates optimized sprite with minimal size
+- Processes large icon sets in parallel across all CPU cores
+- Icons with identical content are emitted once and referenced via <use>
 
 Output:
 - Creates NUI/assets/material-icons-sprite.svg
 - Displays file size and icon count
 """
 
+import hashlib
+import io
+import math
 import os
 import re
-import xml.etree.ElementTree as ET
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+
+# Tags are matched fully qualified (plus bare, for un-namespaced files), so no prefix stripping is needed
+SVG_NS = '{http://www.w3.org/2000/svg}'
+DRAWABLE_NAMES = ('path', 'rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon')
+DRAWABLE_TAGS = frozenset(SVG_NS + name for name in DRAWABLE_NAMES) | frozenset(DRAWABLE_NAMES)
+PATH_TAGS = frozenset((SVG_NS + 'path', 'path'))
+RECT_TAGS = frozenset((SVG_NS + 'rect', 'rect'))
+
+# Background paths covering the full 24x24 viewBox
+BG_24 = frozenset({
+    'M0 0h24v24H0z',
+    'M0 0h24v24H0V0z',
+    'M0,0h24v24H0V0z',
+    'M.01 0h24v24h-24V0z',
+})
+
+# Common rect attribute values (None = attribute missing), skips float() parsing
+_NUM_CACHE = {None: 0.0, '0': 0.0, '24': 24.0}
+
+# Below this many files the process pool spawn cost isn't worth it
+PARALLEL_THRESHOLD = 200
+PARALLEL_CHUNKSIZE = 64
+
+# Report progress every N files instead of once per icon
+PROGRESS_INTERVAL = 200
+
+# Fast path patterns (raw bytes, no XML parsing)
+VIEWBOX_RE = re.compile(rb'(?<![\w:.-])viewBox="([^"]+)"')
+PATH_RE = re.compile(rb'<path\b([^>]*?)\s*/?>')
+TAG_RE = re.compile(rb'<([A-Za-z][\w:.-]*)')
+ATTR_RE = re.compile(rb'([\w:.-]+)\s*=\s*"([^"]*)"')
+ATTR_LIST_RE = re.compile(rb'(?:\s+[\w:.-]+\s*=\s*"[^"]*")*\s*')
+CLOSE_PATH_RE = re.compile(rb'\s*</path\s*>')
+
+# SVG transform list parsing
+TRANSFORM_RE = re.compile(r'\s*([A-Za-z]+)\s*\(([^)]*)\)\s*,?')
+NUMBER_RE = re.compile(r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?')
+
+Matrix = List[List[float]]
+IDENTITY = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+try:
+    import lxml.etree as ET
+    HAS_LXML = True
+    # Only drawable leaves are reported by iterparse
+    ITERPARSE_OPTIONS = {
+        'tag': [f'{{*}}{name}' for name in DRAWABLE_NAMES],
+        'remove_blank_text': True,
+        'remove_comments': True,
+        'huge_tree': False,
+    }
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+    ITERPARSE_OPTIONS = {}
 
 def parse_viewbox(viewbox_str: str) -> Tuple[float, float, float, float]:
     """Parse viewBox string into x, y, width, height values."""
@@ -37,41 +100,41 @@ def parse_viewbox(viewbox_str: str) -> Tuple[float, float, float, float]:
         pass
     return (0, 0, 24, 24)  # Default fallback
 
+def _num(value: Optional[str]) -> float:
+    """Parse a numeric attribute value, using _NUM_CACHE for the common cases."""
+    cached = _NUM_CACHE.get(value)
+    return cached if cached is not None else float(value)
+
+@lru_cache(maxsize=64)
+def bg_patterns(viewbox: Tuple[float, float, float, float]) -> frozenset:
+    """Background path patterns (covering the entire viewBox) for a given viewBox."""
+    vx, vy, vw, vh = viewbox
+    return BG_24 | {
+        f'M{vx} {vy}h{vw}v{vh}H{vx}z',
+        f'M{vx} {vy}h{vw}v{vh}H{vx}V{vy}z',
+        f'M{vx},{vy}h{vw}v{vh}H{vx}V{vy}z',
+        f'M{vx} {vy}h{int(vw)}v{int(vh)}H{vx}z',
+        f'M{vx} {vy}h{int(vw)}v{int(vh)}H{vx}V{vy}z',
+    }
+
 def is_background_element(element: ET.Element, viewbox: Tuple[float, float, float, float]) -> bool:
     """Determine if an element is a background/invisible element that should be filtered out."""
-    tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
-    
     # Check for explicit fill="none"
     if element.get('fill') == 'none':
         return True
     
     # Check for common background patterns in path elements
-    if tag == 'path':
+    if element.tag in PATH_TAGS:
         d_attr = element.get('d', '')
-        vx, vy, vw, vh = viewbox
-        
-        # Common background patterns (covering entire viewBox)
-        background_patterns = [
-            f'M{vx} {vy}h{vw}v{vh}H{vx}z',
-            f'M{vx} {vy}h{vw}v{vh}H{vx}V{vy}z',
-            f'M{vx},{vy}h{vw}v{vh}H{vx}V{vy}z',
-            f'M{vx} {vy}h{int(vw)}v{int(vh)}H{vx}z',
-            f'M{vx} {vy}h{int(vw)}v{int(vh)}H{vx}V{vy}z',
-            'M0 0h24v24H0z',
-            'M0 0h24v24H0V0z',
-            'M0,0h24v24H0V0z',
-            'M.01 0h24v24h-24V0z'
-        ]
-        
-        if any(d_attr.strip() == pattern for pattern in background_patterns):
+        if d_attr.strip() in bg_patterns(viewbox):
             return True
     
     # Check for background rectangles (covering entire viewBox)
-    if tag == 'rect':
-        x = float(element.get('x', 0))
-        y = float(element.get('y', 0))
-        width = float(element.get('width', 0))
-        height = float(element.get('height', 0))
+    if element.tag in RECT_TAGS:
+        x = _num(element.get('x'))
+        y = _num(element.get('y'))
+        width = _num(element.get('width'))
+        height = _num(element.get('height'))
         
         vx, vy, vw, vh = viewbox
         if x == vx and y == vy and width >= vw and height >= vh:
@@ -79,100 +142,239 @@ def is_background_element(element: ET.Element, viewbox: Tuple[float, float, floa
     
     return False
 
-def normalize_element_to_24x24(element: ET.Element, source_viewbox: Tuple[float, float, float, float]) -> Optional[ET.Element]:
-    """Normalize an SVG element from any coordinate system to 24x24."""
-    vx, vy, vw, vh = source_viewbox
-    
-    # If already 24x24 system, return as-is
-    if (vx, vy, vw, vh) == (0, 0, 24, 24):
-        element.set('fill', 'currentColor')
-        return element
-    
-    # Create transform for coordinate normalization
+@lru_cache(maxsize=32)
+def normalize_matrix(viewbox: Tuple[float, float, float, float]) -> Tuple[Tuple[float, ...], ...]:
+    """Affine matrix mapping a viewBox onto 24x24."""
+    vx, vy, vw, vh = viewbox
     scale_x = 24 / vw
     scale_y = 24 / vh
-    translate_x = -vx * scale_x
-    translate_y = -vy * scale_y
+    return ((scale_x, 0.0, -vx * scale_x), (0.0, scale_y, -vy * scale_y), (0.0, 0.0, 1.0))
+
+@lru_cache(maxsize=32)
+def transform_for(viewbox: Tuple[float, float, float, float]) -> Optional[str]:
+    """Transform string form of normalize_matrix() (None if nothing to do)."""
+    (scale_x, _, translate_x), (_, scale_y, translate_y), _ = normalize_matrix(viewbox)
     
-    # Build transform string
     transforms = []
     if translate_x != 0 or translate_y != 0:
         transforms.append(f'translate({translate_x},{translate_y})')
     if scale_x != 1 or scale_y != 1:
         transforms.append(f'scale({scale_x},{scale_y})')
     
-    if transforms:
-        # Combine with existing transform if present
+    return ' '.join(transforms) or None
+
+def mat_mul(a: Matrix, b: Matrix) -> Matrix:
+    """Multiply two 3x3 affine matrices."""
+    return [[sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3)] for i in range(3)]
+
+def parse_transform(transform_str: str) -> Optional[Matrix]:
+    """Parse an SVG transform list into a single 3x3 matrix (None if unsupported)."""
+    result = IDENTITY
+    pos = 0
+    transform_str = transform_str.strip()
+    
+    while pos < len(transform_str):
+        match = TRANSFORM_RE.match(transform_str, pos)
+        if match is None:
+            return None
+        pos = match.end()
+        
+        name = match.group(1)
+        args = [float(v) for v in NUMBER_RE.findall(match.group(2))]
+        
+        if name == 'matrix' and len(args) == 6:
+            a, b, c, d, e, f = args
+            m = [[a, c, e], [b, d, f], [0.0, 0.0, 1.0]]
+        elif name == 'translate' and len(args) in (1, 2):
+            tx, ty = args[0], args[1] if len(args) == 2 else 0.0
+            m = [[1.0, 0.0, tx], [0.0, 1.0, ty], [0.0, 0.0, 1.0]]
+        elif name == 'scale' and len(args) in (1, 2):
+            sx, sy = args[0], args[1] if len(args) == 2 else args[0]
+            m = [[sx, 0.0, 0.0], [0.0, sy, 0.0], [0.0, 0.0, 1.0]]
+        elif name == 'rotate' and len(args) in (1, 3):
+            angle = math.radians(args[0])
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            m = [[cos_a, -sin_a, 0.0], [sin_a, cos_a, 0.0], [0.0, 0.0, 1.0]]
+            if len(args) == 3:
+                # rotate(a, cx, cy) = translate(cx, cy) rotate(a) translate(-cx, -cy)
+                cx, cy = args[1], args[2]
+                m[0][2] = cx - cos_a * cx + sin_a * cy
+                m[1][2] = cy - sin_a * cx - cos_a * cy
+        else:
+            return None
+        
+        result = mat_mul(result, m)
+    
+    return result
+
+def normalize_element_to_24x24(element: ET.Element, source_viewbox: Tuple[float, float, float, float]) -> Optional[ET.Element]:
+    """Normalize an SVG element from any coordinate system to 24x24."""
+    vx, vy, vw, vh = source_viewbox
+    
+    # If already 24x24 system, return as-is
+    if (vx, vy, vw, vh) == (0, 0, 24, 24):
+        element.set('fill', 'currentColor')
+        return element
+    
+    new_transform = transform_for(source_viewbox)
+    if new_transform:
+        # Combine with existing transform if present (normalization applies last)
         existing_transform = element.get('transform', '')
-        new_transform = ' '.join(transforms)
-        if existing_transform:
-            element.set('transform', f'{existing_transform} {new_transform}')
+        existing_matrix = parse_transform(existing_transform) if existing_transform else None
+        if existing_matrix is not None:
+            product = mat_mul(normalize_matrix(source_viewbox), existing_matrix)
+            a, c, e = product[0]
+            b, d, f = product[1]
+            if all(math.isclose(v, w, abs_tol=1e-9) for v, w in zip((a, b, c, d, e, f), (1, 0, 0, 1, 0, 0))):
+                del element.attrib['transform']
+            else:
+                element.set('transform', 'matrix({})'.format(','.join(f'{v:.10g}' for v in (a, b, c, d, e, f))))
+        elif existing_transform:
+            element.set('transform', f'{new_transform} {existing_transform}')
         else:
             element.set('transform', new_transform)
     
     element.set('fill', 'currentColor')
     return element
 
-def extract_icon_elements(svg_content: str) -> List[ET.Element]:
-    """Extract meaningful SVG elements from content, excluding backgrounds."""
-    try:
-        # Parse SVG
-        root = ET.fromstring(svg_content)
+def extract_fast_path_elements(data: bytes) -> Optional[List[str]]:
+    """Extract path elements from a plain 24x24 path-only SVG without parsing XML.
+    
+    Paths are copied from the original bytes, since a 24x24 icon needs no transform.
+    
+    Returns None when the file doesn't match cleanly and needs the full parser.
+    """
+    viewbox_match = VIEWBOX_RE.search(data)
+    if viewbox_match is None or viewbox_match.group(1) != b'0 0 24 24':
+        return None
+    
+    # Only <svg> and <path> are allowed; comments/doctypes go the full route
+    if b'<!' in data:
+        return None
+    tags = TAG_RE.findall(data)
+    if tags.count(b'svg') != 1 or len(tags) - 1 != tags.count(b'path'):
+        return None
+    
+    matches = list(PATH_RE.finditer(data))
+    if len(matches) != len(tags) - 1:
+        return None
+    
+    # Truncated/unbalanced files must reach the parser so the error gets reported:
+    # the document has to close with </svg> and every open <path> needs its </path>
+    if not data.rstrip().endswith(b'</svg>'):
+        return None
+    open_paths = [match for match in matches if not match.group(0).endswith(b'/>')]
+    if data.count(b'</') != len(open_paths) + 1:
+        return None
+    if any(CLOSE_PATH_RE.match(data, match.end()) is None for match in open_paths):
+        return None
+    
+    element_strings = []
+    for match in matches:
+        # Attributes must be whitespace-separated, unique name="value" pairs, since the
+        # element bytes are copied verbatim; anything else is left for the parser to reject
+        attr_bytes = match.group(1)
+        if ATTR_LIST_RE.fullmatch(attr_bytes) is None:
+            return None
+        attr_pairs = ATTR_RE.findall(attr_bytes)
+        attrs = dict(attr_pairs)
+        if len(attrs) != len(attr_pairs):
+            return None
+        d = attrs.get(b'd')
+        if d is None:
+            return None
         
-        # Get viewBox
-        viewbox_str = root.get('viewBox', '0 0 24 24')
-        viewbox = parse_viewbox(viewbox_str)
+        fill = attrs.get(b'fill')
+        if fill == b'none':
+            continue
+        if fill is not None:
+            # An explicit fill has to be replaced, leave that to the full route
+            return None
         
-        # Find all drawable elements (recursively)
-        drawable_elements = []
-        drawable_tags = {'path', 'rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon'}
+        d_attr = d.decode('utf-8').strip()
+        if d_attr in BG_24:
+            continue
         
-        def collect_elements(parent):
-            for element in parent:
-                tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
-                
-                if tag in drawable_tags:
-                    if not is_background_element(element, viewbox):
-                        # Normalize to 24x24 coordinate system
-                        normalized = normalize_element_to_24x24(element, viewbox)
-                        if normalized is not None:
-                            drawable_elements.append(normalized)
-                else:
-                    # Recurse into groups and other containers
-                    collect_elements(element)
+        # Pass the original element bytes through, only adding the fill
+        element = match.group(0).rstrip(b'>').rstrip().rstrip(b'/').rstrip()
+        element_strings.append(element.decode('utf-8') + ' fill="currentColor"/>')
+    
+    return element_strings
+
+def extract_icon_elements(data: bytes) -> List[str]:
+    """Stream drawable elements out of raw SVG bytes and return them serialized, excluding backgrounds.
+    
+    Raises ET.ParseError for malformed files.
+    """
+    viewbox = None
+    element_strings = []
+    
+    # Parse the bytes already read for the fast path, no decode/re-read
+    for event, element in ET.iterparse(io.BytesIO(data), events=('start', 'end'), **ITERPARSE_OPTIONS):
+        # Get viewBox from the root (whatever its tag) on the first event; without lxml's
+        # tag filter that first event is the root itself opening
+        if viewbox is None:
+            root = element.getroottree().getroot() if HAS_LXML else element
+            viewbox = parse_viewbox(root.get('viewBox', '0 0 24 24'))
+        if event == 'start':
+            continue
+    
+        if element.tag not in DRAWABLE_TAGS:
+            continue
+    
+        if not is_background_element(element, viewbox):
+            # Normalize to 24x24 coordinate system
+            normalized = normalize_element_to_24x24(element, viewbox)
+            if normalized is not None:
+                element_strings.append(ET.tostring(normalized, encoding='unicode').strip())
+    
+        # Drop the finished element (and earlier siblings) to keep the tree small
+        element.clear()
+        if HAS_LXML:
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    
+    return element_strings
+
+def process_one(svg_path: str, icon_name: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Convert a single SVG file into the body (indented elements) of a sprite symbol.
+    
+    Returns (icon_name, symbol_body, error). symbol_body is None if the icon was skipped,
+    error is set if it failed; nothing is printed so results can be reported in order.
+    """
+    try:
+        # Extract meaningful elements (fast path first, full parser otherwise)
+        with open(svg_path, 'rb') as f:
+            data = f.read()
+        elements = extract_fast_path_elements(data)
+        if elements is None:
+            elements = extract_icon_elements(data)
+        
+        if not elements:
+            return icon_name, None, None
         
-        collect_elements(root)
-        return drawable_elements
+        return icon_name, '\n'.join(f'    {element_str}' for element_str in elements), None
         
     except ET.ParseError as e:
-        print(f"   ❌ XML Parse Error: {e}")
-        return []
+        return icon_name, None, f"XML Parse Error: {e}"
     except Exception as e:
-        print(f"   ❌ Unexpected error: {e}")
-        return []
+        return icon_name, None, f"Unexpected error: {e}"
 
-def optimize_sprite_content(content):
-    """Optimize sprite content by formatting and removing extra whitespace."""
-    lines = content.split('\n')
-    optimized_lines = []
-    
-    for line in lines:
-        stripped = line.strip()
-        if stripped:
-            # Apply minimal indentation for readability
-            if stripped.startswith('<symbol'):
-                optimized_lines.append('  ' + stripped)
-            elif stripped.startswith('<path'):
-                optimized_lines.append('    ' + stripped)
-            elif stripped.startswith('</symbol>'):
-                optimized_lines.append('  ' + stripped)
-            else:
-                optimized_lines.append(stripped)
+def iter_symbols(svg_paths: List[str], icon_names: List[str]) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+    """Yield process_one() results in input order, in parallel for large sets."""
+    if len(svg_paths) < PARALLEL_THRESHOLD:
+        yield from map(process_one, svg_paths, icon_names)
+        return
     
-    return '\n'.join(optimized_lines)
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(process_one, svg_paths, icon_names, chunksize=PARALLEL_CHUNKSIZE)
 
 def generate_sprite():
     """Main function to generate the SVG sprite."""
+    # Per-icon output is batched, so don't flush stdout on every line
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     # Paths
     icons_dir = Path(__file__).parent / 'Material_Icons'
     output_file = Path(__file__).parent.parent / 'NUI' / 'assets' / 'material-icons-sprite.svg'
@@ -182,76 +384,87 @@ def generate_sprite():
         print(f"❌ Error: Icons directory not found: {icons_dir}")
         return
     
-    svg_files = list(icons_dir.glob('*.svg'))
-    if not svg_files:
+    # Plain scandir entries sorted by name (no Path objects per file)
+    with os.scandir(icons_dir) as it:
+        entries = [e for e in it if e.name.endswith('.svg') and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    if not entries:
         print(f"❌ Error: No SVG files found in {icons_dir}")
         return
     
     # Create output directory
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Start building sprite
-    sprite_content = ['<svg xmlns="http://www.w3.org/2000/svg" style="display: none;">']
-    processed_count = 0
+    svg_paths = [e.path for e in entries]
+    icon_names = [e.name[:-4] for e in entries]
     
-    print(f"🔄 Processing {len(svg_files)} SVG files...")
+    print(f"🔄 Processing {len(svg_paths)} SVG files...")
     
-    # Process each SVG file
-    for svg_file in sorted(svg_files):
-        icon_name = svg_file.stem
-        
-        try:
-            # Read SVG content
-            with open(svg_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+    # Stream symbols into a temporary file, only replacing the sprite once it's complete
+    tmp_file = output_file.with_suffix('.svg.tmp')
+    processed_count = 0
+    duplicate_count = 0
+    skipped = []
+    errors = []  # (icon_name, message)
+    canonical_names = {}  # body hash -> first icon with that body
+    total = len(svg_paths)
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write('<svg xmlns="http://www.w3.org/2000/svg" style="display: none;">\n')
             
-            # Extract meaningful elements
-            elements = extract_icon_elements(content)
+            for i, (icon_name, body, error) in enumerate(iter_symbols(svg_paths, icon_names), 1):
+                if error is not None:
+                    errors.append((icon_name, error))
+                elif body is not None:
+                    body_hash = hashlib.blake2b(body.encode('utf-8'), digest_size=16).digest()
+                    canonical_name = canonical_names.setdefault(body_hash, icon_name)
+                    if canonical_name == icon_name:
+                        f.write(f'  <symbol id="{icon_name}" viewBox="0 0 24 24">\n{body}\n  </symbol>\n')
+                    else:
+                        # Identical content: reference the first icon instead of repeating it
+                        f.write(f'  <symbol id="{icon_name}" viewBox="0 0 24 24"><use href="#{canonical_name}"/></symbol>\n')
+                        duplicate_count += 1
+                    processed_count += 1
+                else:
+                    skipped.append(icon_name)
+                if i % PROGRESS_INTERVAL == 0:
+                    print(f"   …{i}/{total}")
             
-            # Add symbol to sprite if elements found
-            if elements:
-                sprite_content.append(f'  <symbol id="{icon_name}" viewBox="0 0 24 24">')
-                
-                for element in elements:
-                    # Convert element back to string
-                    element_str = ET.tostring(element, encoding='unicode')
-                    sprite_content.append(f'    {element_str}')
-                
-                sprite_content.append('  </symbol>')
-                processed_count += 1
-                print(f"   ✓ {icon_name}")
-            else:
-                print(f"   ⚠ Skipped {icon_name} (no valid elements found)")
-                
-        except Exception as e:
-            print(f"   ❌ Error processing {icon_name}: {e}")
-    
-    # Close sprite
-    sprite_content.append('</svg>')
-    
-    # Optimize content
-    optimized_content = optimize_sprite_content('\n'.join(sprite_content))
-    
-    # Write output file
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(optimized_content)
-        
-        # Report results
-        file_size = output_file.stat().st_size
-        print(f"\n✅ Success!")
-        print(f"   📁 Output: {output_file}")
-        print(f"   📊 Icons: {processed_count}")
-        print(f"   💾 Size: {file_size / 1024:.2f} KB")
+            f.write('</svg>\n')
         
-        # Usage example
-        print(f"\n📋 Usage example:")
-        print(f'   <svg width="24" height="24">')
-        print(f'     <use href="NUI/assets/material-icons-sprite.svg#menu"/>')
-        print(f'   </svg>')
+        os.replace(tmp_file, output_file)
         
-    except Exception as e:
+    except OSError as e:
         print(f"❌ Error writing output file: {e}")
+        return
+    except Exception as e:
+        print(f"❌ Error processing icons: {e}")
+        return
+    finally:
+        # Leaves the previous sprite untouched if anything went wrong (incl. Ctrl-C)
+        tmp_file.unlink(missing_ok=True)
+    
+    if skipped:
+        print(f"   ⚠ Skipped {len(skipped)} icons (no valid elements found): {', '.join(skipped)}")
+    if errors:
+        print(f"   ❌ Failed {len(errors)} icons:")
+        for icon_name, message in errors:
+            print(f"      {icon_name}: {message}")
+    
+    # Report results
+    file_size = output_file.stat().st_size
+    print(f"\n✅ Success!")
+    print(f"   📁 Output: {output_file}")
+    print(f"   📊 Icons: {processed_count}")
+    if duplicate_count:
+        print(f"   🔁 Duplicates: {duplicate_count} (referenced via <use>)")
+    print(f"   💾 Size: {file_size / 1024:.2f} KB")
+    
+    # Usage example
+    print(f"\n📋 Usage example:")
+    print(f'   <svg width="24" height="24">')
+    print(f'     <use href="NUI/assets/material-icons-sprite.svg#menu"/>')
+    print(f'   </svg>')
 
 if __name__ == "__main__":
     generate_sprite()
\ No newline at end of file